@@ -1,9 +1,15 @@
 import os
+import argparse
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from espn_api.football import League
 from openai import OpenAI
 import requests
 import json
-from typing import Dict, List, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 
 # Configuration
 espn_s2 = os.getenv("ESPN_S2")
@@ -12,8 +18,151 @@ league_ids = [1198961, 1542043, 1004103369, 635235368]  # Example IDs
 season_year = 2025
 last_name = "Diderich"
 
-# Initialize OpenAI client (set your API key as environment variable: OPENAI_API_KEY)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client (set your API key as environment variable: OPENAI_API_KEY).
+# Without a key the script still runs, reporting the local optimizer's lineup only.
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY")) if os.getenv("OPENAI_API_KEY") else None
+
+# search_web tool settings. SEARCH_BACKEND=local swaps in an offline stand-in
+# that answers from the JSON file at SEARCH_FIXTURES (query -> result text).
+analysis_model = "gpt-4.1"
+max_tool_rounds = 4
+search_workers = 8
+
+ANALYSIS_KEYS = [
+    "overall_analysis",
+    "key_recommendations",
+    "start_sit_suggestions",
+    "injury_concerns",
+    "risk_assessment",
+    "expected_point_improvements",
+    "overall_team_potential",
+]
+
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "lineup_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                key: (
+                    {"type": "string"}
+                    if key in ("overall_analysis", "overall_team_potential")
+                    else {"type": "array", "items": {"type": "string"}}
+                )
+                for key in ANALYSIS_KEYS
+            },
+            "required": ANALYSIS_KEYS,
+            "additionalProperties": False,
+        },
+    },
+}
+
+SEARCH_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "search_web",
+            "description": "Search the web for latest player news or matchup stats",
+            "parameters": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+                "required": ["query"],
+            },
+        },
+    }
+]
+
+
+class OpenAIWebSearchBackend:
+    """Answers search_web queries with OpenAI's hosted web_search tool."""
+
+    def __init__(self, openai_client: OpenAI, model: str = analysis_model):
+        self.client = openai_client
+        self.model = model
+
+    def search(self, query: str) -> str:
+        response = self.client.responses.create(
+            model=self.model,
+            tools=[{"type": "web_search"}],
+            input=query,
+        )
+        return response.output_text
+
+
+class LocalSearchBackend:
+    """Offline stand-in for tests and dry runs; serves canned results."""
+
+    def __init__(self, results: Optional[Dict[str, str]] = None):
+        self.results = results or {}
+        self.queries: List[str] = []
+
+    def search(self, query: str) -> str:
+        self.queries.append(query)
+        return self.results.get(query, f"No local results for '{query}'.")
+
+
+class CachedSearch:
+    """
+    Runs search_web lookups concurrently and memoizes them per query for the
+    whole run, so the same player news is only fetched once across all teams.
+    """
+
+    def __init__(self, backend, max_workers: int = search_workers):
+        self.backend = backend
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def submit(self, query: str) -> Future:
+        """Start a lookup, or join the one already running/finished for this query."""
+        key = self._cache_key(query)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(self.backend.search, query)
+                self._futures[key] = future
+        return future
+
+    def search_many(self, queries: List[str]) -> List[str]:
+        """Resolve a batch of queries in parallel, preserving order."""
+        futures = [self.submit(query) for query in queries]
+        results = []
+        for query, future in zip(queries, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Don't cache failures; a later team may retry the lookup.
+                with self._lock:
+                    if self._futures.get(self._cache_key(query)) is future:
+                        del self._futures[self._cache_key(query)]
+                results.append(f"Search failed for '{query}': {e}")
+        return results
+
+    def clear(self):
+        """Forget cached results so the next lookups fetch fresh news."""
+        with self._lock:
+            self._futures.clear()
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_search_backend():
+    """Pick the search_web backend from the SEARCH_BACKEND environment variable."""
+    if client is None or os.getenv("SEARCH_BACKEND", "openai").lower() == "local":
+        fixtures_path = os.getenv("SEARCH_FIXTURES")
+        results = {}
+        if fixtures_path:
+            with open(fixtures_path) as f:
+                results = json.load(f)
+        return LocalSearchBackend(results)
+    return OpenAIWebSearchBackend(client)
 
 
 def get_league_data() -> List[League]:
@@ -30,8 +179,266 @@ def get_league_data() -> List[League]:
     return leagues
 
 
-def get_team_lineup_data(leagues: List[League]) -> List[Dict]:
-    """Get current lineup data for all your teams"""
+def register_player(player_registry: Dict[int, Dict], player) -> int:
+    """
+    Add a player to the run-wide registry (keyed by ESPN player ID) the first
+    time they're seen. Only league-independent details live here; points depend
+    on each league's scoring settings and stay on the lineup entry.
+    """
+    player_id = player.playerId
+    if player_id not in player_registry:
+        player_registry[player_id] = {
+            "name": player.name,
+            "position": player.position,
+            "team": player.proTeam,
+            "injured": player.injured,
+            "injury_status": player.injuryStatus,
+            "percent_owned": player.percent_owned,
+            "percent_started": player.percent_started,
+            "eligible_slots": [
+                slot for slot in player.eligibleSlots if slot not in ("BE", "IR")
+            ],
+            "news": None,
+        }
+    return player_id
+
+
+def gather_player_news(
+    player_registry: Dict[int, Dict],
+    search: "CachedSearch",
+    only_player_ids: Optional[set] = None,
+):
+    """
+    Look up news once per unique player with an injury designation, in
+    parallel, and store it on the registry entry for every league to share.
+    Pass `only_player_ids` to limit the lookups to a subset of players.
+    """
+    player_ids = [
+        player_id
+        for player_id, info in player_registry.items()
+        if info["news"] is None
+        and (only_player_ids is None or player_id in only_player_ids)
+        and info["injury_status"] not in (None, "ACTIVE", "NORMAL")
+    ]
+    if not player_ids:
+        return
+
+    queries = [
+        f"{player_registry[player_id]['name']} {player_registry[player_id]['team']} injury news this week"
+        for player_id in player_ids
+    ]
+    print(f"Gathering news for {len(queries)} player(s) with injury designations...")
+    for player_id, news in zip(player_ids, search.search_many(queries)):
+        player_registry[player_id]["news"] = news
+
+
+def expand_lineup_players(entries: List[Dict], player_registry: Dict[int, Dict]) -> List[Dict]:
+    """Join lineup entries with their shared registry details for the prompt."""
+    expanded = []
+    for entry in entries:
+        player = {**player_registry[entry["player_id"]], **entry}
+        if player["news"] is None:
+            del player["news"]
+        expanded.append(player)
+    return expanded
+
+# Lineup optimizer
+NON_STARTER_STATUSES = ("OUT", "IR", "INJURY_RESERVE", "SUSPENSION")
+INELIGIBLE_COST = 1e9
+
+
+def get_starting_slots(league: League, team) -> List[str]:
+    """
+    List every starting lineup slot for this league, e.g. ["QB", "RB", "RB", ...].
+    Falls back to the slots the team is currently using if the league settings
+    don't include slot counts.
+    """
+    slot_counts = getattr(league.settings, "position_slot_counts", None) or {}
+    slots = [
+        slot
+        for slot, count in slot_counts.items()
+        if slot not in ("BE", "IR", "")
+        for _ in range(count)
+    ]
+    if slots:
+        return slots
+    return [
+        player.lineupSlot
+        for player in team.roster
+        if player.lineupSlot not in ("BE", "IR", "")
+    ]
+
+
+def _hungarian(cost: List[List[float]]) -> List[int]:
+    """
+    Minimum-cost assignment for an n x m cost matrix with n <= m.
+    Returns the assigned column for each row.
+    """
+    n, m = len(cost), len(cost[0])
+    u, v = [0.0] * (n + 1), [0.0] * (m + 1)
+    p, way = [0] * (m + 1), [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [float("inf")] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0, delta, j1 = p[j0], float("inf"), 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = cost[i0 - 1][j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return assignment
+
+
+def week_projection(player, week: int) -> tuple:
+    """
+    Return (projected points, on bye) for `week`. Uses ESPN's projection for the
+    week when the roster data includes one, else the season-average projection.
+    A player whose pro team has no game that week is on bye.
+    """
+    schedule = getattr(player, "schedule", None) or {}
+    on_bye = bool(schedule) and str(week) not in schedule and week not in schedule
+    weekly = (getattr(player, "stats", None) or {}).get(week, {}).get("projected_points")
+    if on_bye:
+        return 0, True
+    if weekly is not None:
+        return weekly, False
+    return player.projected_avg_points, False
+
+
+def _can_start(player: Dict) -> bool:
+    return (
+        player["injury_status"] not in NON_STARTER_STATUSES
+        and not player["on_bye"]
+        and (player["projected_points"] or 0) > 0
+        and player["slot_position"] != "IR"
+    )
+
+
+def optimize_lineup(lineup_data: Dict, player_registry: Dict[int, Dict]) -> Dict:
+    """
+    Compute the highest-projected legal starting lineup for a team.
+
+    Solves the slot assignment exactly over this week's `projected_points`,
+    never starting OUT/IR players, players on bye, or anyone projected for 0. Returns the optimal
+    lineup, the current and optimal projected totals, and the moves needed.
+    """
+    players = expand_lineup_players(
+        lineup_data["roster"] + lineup_data["bench"], player_registry
+    )
+    slots = lineup_data["starting_slots"]
+    candidates = [player for player in players if _can_start(player)]
+
+    current_points = sum(
+        player["projected_points"]
+        for player in players
+        if player["slot_position"] not in ("BE", "IR") and _can_start(player)
+    )
+
+    optimal_lineup = []
+    if slots:
+        # One extra "empty" column per slot so every slot can go unfilled.
+        cost = [
+            [
+                -player["projected_points"]
+                if slot in player["eligible_slots"]
+                else INELIGIBLE_COST
+                for player in candidates
+            ]
+            + [0.0] * len(slots)
+            for slot in slots
+        ]
+        for slot, column in zip(slots, _hungarian(cost)):
+            player = candidates[column] if column < len(candidates) else None
+            if player is not None and slot not in player["eligible_slots"]:
+                player = None
+            optimal_lineup.append(
+                {
+                    "slot": slot,
+                    "player_id": player["player_id"] if player else None,
+                    "name": player["name"] if player else None,
+                    "projected_points": (
+                        player["projected_points"] if player else 0
+                    ),
+                }
+            )
+
+    optimal_points = sum(entry["projected_points"] for entry in optimal_lineup)
+    optimal_ids = {entry["player_id"] for entry in optimal_lineup if entry["player_id"]}
+    current_ids = {
+        player["player_id"]
+        for player in players
+        if player["slot_position"] not in ("BE", "IR")
+    }
+    moves = [
+        f"Start {entry['name']} at {entry['slot']} ({entry['projected_points']:.1f} proj)"
+        for entry in optimal_lineup
+        if entry["player_id"] and entry["player_id"] not in current_ids
+    ] + [
+        f"Sit {player['name']} ({player.get('injury_status') or 'ACTIVE'}, "
+        + ("BYE)" if player["on_bye"] else f"{player['projected_points'] or 0:.1f} proj)")
+        for player in players
+        if player["player_id"] in current_ids - optimal_ids
+    ]
+
+    return {
+        "optimal_lineup": optimal_lineup,
+        "current_projected_points": round(current_points, 2),
+        "optimal_projected_points": round(optimal_points, 2),
+        "point_delta": round(optimal_points - current_points, 2),
+        "moves": moves,
+    }
+
+
+def optimizer_analysis(optimization: Dict) -> Dict:
+    """Build a report in the OpenAI analysis format from optimizer output alone."""
+    delta = optimization["point_delta"]
+    return {
+        "overall_analysis": (
+            f"Optimal lineup projects {optimization['optimal_projected_points']:.1f} "
+            f"points vs {optimization['current_projected_points']:.1f} for the current lineup."
+        ),
+        "start_sit_suggestions": optimization["moves"]
+        or ["Current lineup is already optimal."],
+        "expected_point_improvements": [f"{delta:+.1f} projected points"],
+    }
+
+
+def get_team_lineup_data(
+    leagues: List[League],
+    player_registry: Dict[int, Dict],
+    matchup_opponents: Optional[Dict] = None,
+) -> List[Dict]:
+    """
+    Get current lineup data for all your teams. Each roster entry holds the
+    ESPN player ID plus league-specific fields; shared player details are
+    collected once in `player_registry`. Opponents already known from
+    `matchup_opponents` (keyed by (league_id, team_name)) skip the scoreboard call.
+    """
     team_lineups = []
 
     for i, league in enumerate(leagues):
@@ -42,28 +449,28 @@ def get_team_lineup_data(leagues: List[League]) -> List[Dict]:
             for owner in team.owners:
                 if last_name == owner["lastName"]:
                     lineup_data = {
-                        "league_id": league_ids[i],
+                        "league_id": getattr(league, "league_id", league_ids[i]),
                         "team_name": getattr(
                             team, "team_name", getattr(team, "teamName", f"Team {i+1}")
                         ),
                         "roster": [],
                         "bench": [],
                         "matchup_opponent": None,
+                        "starting_slots": get_starting_slots(league, team),
                     }
 
                     for player in team.roster:
+                        projected_points, on_bye = week_projection(
+                            player, league.current_week
+                        )
                         player_info = {
-                            "name": player.name,
-                            "position": player.position,
-                            "team": player.proTeam,
+                            "player_id": register_player(player_registry, player),
                             "slot_position": player.lineupSlot,
+                            "projected_points": projected_points,
+                            "on_bye": on_bye,
                             "projected_avg_points": player.projected_avg_points,
                             "avg_points": player.avg_points,
                             "total_points": player.total_points,
-                            "injured": player.injured,
-                            "injury_status": player.injuryStatus,
-                            "percent_owned": player.percent_owned,
-                            "percent_started": player.percent_started,
                         }
 
                         if player.lineupSlot == "BE":
@@ -71,6 +478,14 @@ def get_team_lineup_data(leagues: List[League]) -> List[Dict]:
                         else:
                             lineup_data["roster"].append(player_info)
 
+                    known_opponent = (matchup_opponents or {}).get(
+                        (lineup_data["league_id"], lineup_data["team_name"])
+                    )
+                    if known_opponent:
+                        lineup_data["matchup_opponent"] = known_opponent
+                        team_lineups.append(lineup_data)
+                        break
+
                     try:
                         matchups = league.scoreboard()
                         for matchup in matchups:
@@ -106,16 +521,34 @@ def get_team_lineup_data(leagues: List[League]) -> List[Dict]:
     return team_lineups
 
 
-def analyze_lineup_with_openai(lineup_data: Dict) -> Dict:
-    """Use OpenAI to analyze lineup and suggest optimizations, returning JSON."""
+def _prompt_player(player: Dict) -> Dict:
+    """Trim a player down to the fields the model needs for its narrative."""
+    keys = ("name", "position", "team", "slot_position", "projected_points", "on_bye", "injury_status", "news")
+    return {key: player[key] for key in keys if key in player}
+
+
+def analyze_lineup_with_openai(
+    lineup_data: Dict,
+    player_registry: Dict[int, Dict],
+    optimization: Dict,
+    search: CachedSearch,
+) -> Dict:
+    """
+    Use OpenAI to explain the optimizer's lineup and add context, returning JSON.
+    search_web tool calls are executed through the run-wide `search` cache until
+    the model answers.
+    """
     system_prompt = """You are an expert fantasy football analyst.
         Your response MUST be a JSON object with the following keys. Each key's value should be either a string or a list of strings (for bullet points).
 
         **CRITICAL RULES:**
         1.  **NEVER** recommend starting a player whose `injury_status` is 'OUT' or 'IR'.
-        2.  **ALWAYS** treat a `projected_avg_points` of 0 as a non-starter.
+        2.  **ALWAYS** treat a `projected_points` of 0, or `on_bye`, as a non-starter.
         3.  Heavily weigh the `injury_status` in all recommendations. A player who is 'Questionable' is a significant risk.
 
+        The OPTIMAL LINEUP has already been computed from projections and these rules. Do not second-guess it; explain it.
+        Players with an injury designation already include the latest `news`. Only use the `search_web` tool for information that is missing.
+
         {
         "overall_analysis": "Your overall summary here.",
         "key_recommendations": [
@@ -148,49 +581,84 @@ def analyze_lineup_with_openai(lineup_data: Dict) -> Dict:
         TEAM: {lineup_data['team_name']} (League ID: {lineup_data['league_id']})
         OPPONENT: {lineup_data['matchup_opponent']}
 
-        CURRENT STARTING LINEUP:
-        {json.dumps(lineup_data['roster'], indent=2)}
+        ROSTER:
+        {json.dumps([_prompt_player(p) for p in expand_lineup_players(lineup_data['roster'] + lineup_data['bench'], player_registry)])}
+
+        OPTIMAL LINEUP ({optimization['optimal_projected_points']:.1f} projected, {optimization['point_delta']:+.1f} vs current):
+        {json.dumps([[entry['slot'], entry['name']] for entry in optimization['optimal_lineup']])}
 
-        BENCH PLAYERS:
-        {json.dumps(lineup_data['bench'], indent=2)}
+        MOVES: {json.dumps(optimization['moves'])}
 
         Focus on:
-        1. Should any bench players be started over current starters?
+        1. Why the recommended moves make sense.
         2. Best/worst matchups this week.
         3. Injury concerns/news updates.
-        4. Expected point improvements from recommended changes.
         """
 
+    if client is None:
+        return {"error": "OPENAI_API_KEY is not set"}
+
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+
     try:
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "search_web",
-                    "description": "Search the web for latest player news or matchup stats",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string"}
-                        },
-                        "required": ["query"],
-                    },
-                },
-            }
-        ]
+        for round_num in range(max_tool_rounds + 1):
+            # On the last round tools are disabled so the model must answer.
+            response = client.chat.completions.create(
+                model=analysis_model,
+                messages=messages,
+                tools=SEARCH_TOOLS,
+                tool_choice="auto" if round_num < max_tool_rounds else "none",
+                response_format=ANALYSIS_RESPONSE_FORMAT,
+            )
+            message = response.choices[0].message
+
+            if not message.tool_calls:
+                if not message.content:
+                    raise ValueError(
+                        f"empty completion (refusal: {getattr(message, 'refusal', None)})"
+                    )
+                return json.loads(message.content.strip())
+
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": message.content,
+                    "tool_calls": [
+                        {
+                            "id": call.id,
+                            "type": "function",
+                            "function": {
+                                "name": call.function.name,
+                                "arguments": call.function.arguments,
+                            },
+                        }
+                        for call in message.tool_calls
+                    ],
+                }
+            )
 
-        response = client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            tools=tools,
-            tool_choice="auto",
-        )
+            queries = []
+            for call in message.tool_calls:
+                try:
+                    arguments = json.loads(call.function.arguments)
+                except json.JSONDecodeError:
+                    arguments = None
+                if isinstance(arguments, dict) and arguments.get("query"):
+                    queries.append(str(arguments["query"]))
+                else:
+                    queries.append(call.function.arguments)
+
+            print(f"Running {len(queries)} search_web call(s): {queries}")
+            results = search.search_many(queries)
+            for call, result in zip(message.tool_calls, results):
+                messages.append(
+                    {"role": "tool", "tool_call_id": call.id, "content": result}
+                )
 
-        analysis_json = json.loads(response.choices[0].message.content.strip())
-        return analysis_json
+        raise ValueError("model kept requesting tools after the final round")
 
     except Exception as e:
         print(f"OpenAI API error or JSON parsing error: {e}")
@@ -222,10 +690,13 @@ def send_to_slack(report_blocks: List[Dict]):
         print(f"❌ An error occurred while sending to Slack: {e}")
 
 
-def format_analysis_for_slack(team_name: str, analysis_json: Dict) -> List[Dict]:
+def format_analysis_for_slack(
+    team_name: str, analysis_json: Dict, changes: Optional[List[str]] = None
+) -> List[Dict]:
     """
     Slack formatter:
     - Formats content from the JSON response using appropriate markdown.
+    - Leads with the roster changes that triggered the report, if any (watch mode).
     """
 
     section_config = {
@@ -253,18 +724,21 @@ def format_analysis_for_slack(team_name: str, analysis_json: Dict) -> List[Dict]
         {"type": "divider"},
     ]
 
-    # Define the order of sections for display
-    ordered_keys = [
-        "overall_analysis",
-        "key_recommendations",
-        "start_sit_suggestions",
-        "injury_concerns",
-        "risk_assessment",
-        "expected_point_improvements",
-        "overall_team_potential",
-    ]
+    if changes:
+        blocks.append(
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "🔔 *Changes Since Last Check*\n"
+                    + "\n".join(f"- {change}" for change in changes),
+                },
+            }
+        )
+        blocks.append({"type": "divider"})
 
-    for key in ordered_keys:
+    # Sections are displayed in schema order
+    for key in ANALYSIS_KEYS:
         if key in analysis_json and analysis_json[key]:
             content = analysis_json[key]
             config = section_config.get(
@@ -308,6 +782,36 @@ def format_analysis_for_slack(team_name: str, analysis_json: Dict) -> List[Dict]
     return blocks
 
 
+def report_team(
+    lineup: Dict,
+    player_registry: Dict[int, Dict],
+    search: CachedSearch,
+    changes: Optional[List[str]] = None,
+):
+    """Optimize, analyze and send the Slack report for a single team."""
+    optimization = optimize_lineup(lineup, player_registry)
+    print(
+        f"Optimal lineup: {optimization['optimal_projected_points']:.1f} projected "
+        f"({optimization['point_delta']:+.1f} vs current)"
+    )
+
+    analysis_json = analyze_lineup_with_openai(
+        lineup, player_registry, optimization, search
+    )
+
+    # Print the raw JSON response for debugging
+    print("\nRaw OpenAI Analysis (JSON):\n", json.dumps(analysis_json, indent=2))
+
+    if "error" in analysis_json:
+        print(
+            f"OpenAI unavailable ({analysis_json['error']}), reporting optimizer lineup only."
+        )
+        analysis_json = optimizer_analysis(optimization)
+
+    report_blocks = format_analysis_for_slack(lineup["team_name"], analysis_json, changes)
+    send_to_slack(report_blocks)
+
+
 def main():
     """Main execution with OpenAI lineup optimization and Slack reporting"""
     try:
@@ -318,39 +822,201 @@ def main():
             return
 
         print("Getting team lineups...")
-        team_lineups = get_team_lineup_data(leagues)
+        player_registry: Dict[int, Dict] = {}
+        team_lineups = get_team_lineup_data(leagues, player_registry)
+        print(f"Found {len(player_registry)} unique players across all rosters.")
 
-        for i, lineup in enumerate(team_lineups):
-            team_name = lineup["team_name"]
-            print(f"\n--- Analyzing Team {i+1}: {team_name} ---")
+        # One search cache for the whole run, shared by every team
+        search = CachedSearch(get_search_backend())
+        try:
+            gather_player_news(player_registry, search)
 
-            analysis_json = analyze_lineup_with_openai(lineup)
+            for i, lineup in enumerate(team_lineups):
+                print(f"\n--- Analyzing Team {i+1}: {lineup['team_name']} ---")
+                report_team(lineup, player_registry, search)
+        finally:
+            search.close()
 
-            # Print the raw JSON response for debugging
-            print(
-                "\nRaw OpenAI Analysis (JSON):\n", json.dumps(analysis_json, indent=2)
-            )
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+
+# Watch mode
+# Kickoff times in US/Eastern as (weekday, hour, minute), Monday = 0.
+KICKOFFS_ET = [(3, 20, 15), (6, 9, 30), (6, 13, 0), (6, 16, 5), (6, 20, 20), (0, 20, 15)]
+EASTERN = ZoneInfo("America/New_York")
+full_refresh_interval = timedelta(hours=24)
+
+
+def seconds_until_next_kickoff(now: datetime) -> float:
+    """Seconds from `now` until the next scheduled NFL kickoff window."""
+    now = now.astimezone(EASTERN)
+    candidates = []
+    for weekday, hour, minute in KICKOFFS_ET:
+        kickoff = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        kickoff += timedelta(days=(weekday - now.weekday()) % 7)
+        if kickoff <= now:
+            kickoff += timedelta(days=7)
+        candidates.append(kickoff)
+    return (min(candidates) - now).total_seconds()
+
+
+def next_poll_interval(now: Optional[datetime] = None) -> int:
+    """
+    Poll every 5 minutes in the 2 hours before a kickoff (when inactives and
+    late downgrades land), every 20 minutes within 12 hours, otherwise hourly.
+    """
+    until_kickoff = seconds_until_next_kickoff(now or datetime.now(EASTERN))
+    if until_kickoff <= 2 * 3600:
+        return 5 * 60
+    if until_kickoff <= 12 * 3600:
+        return 20 * 60
+    return 60 * 60
+
+
+def lineup_snapshot(lineup: Dict, player_registry: Dict[int, Dict]) -> Dict[int, tuple]:
+    """Reduce a lineup to {player_id: (name, injury_status, lineup slot)} for diffing."""
+    return {
+        entry["player_id"]: (
+            player_registry[entry["player_id"]]["name"],
+            player_registry[entry["player_id"]]["injury_status"],
+            entry["slot_position"],
+        )
+        for entry in lineup["roster"] + lineup["bench"]
+    }
+
+
+def diff_snapshots(previous: Dict[int, tuple], current: Dict[int, tuple]) -> List[str]:
+    """Describe injury, slot and roster changes between two lineup snapshots."""
+    changes = []
+    for player_id, (name, status, slot) in current.items():
+        if player_id not in previous:
+            changes.append(f"{name} added to roster ({slot})")
+            continue
+        _, old_status, old_slot = previous[player_id]
+        if status != old_status:
+            changes.append(f"{name}: {old_status or 'ACTIVE'} → {status or 'ACTIVE'}")
+        if slot != old_slot:
+            changes.append(f"{name} moved {old_slot} → {slot}")
+    for player_id in previous.keys() - current.keys():
+        changes.append(f"{previous[player_id][0]} left the roster")
+    return changes
+
+
+def refresh_rosters(leagues: List[League], full_refresh: bool = False):
+    """
+    Update the warm League objects in place. Normally this only pulls the
+    lightweight mRoster view; a full refresh also picks up week rollovers.
+    fetch_league() is used rather than refresh(), which would replace the
+    football Settings (and their lineup slot counts) with the base class.
+    """
+    for league in leagues:
+        try:
+            if full_refresh:
+                league.fetch_league()
+            else:
+                league.load_roster_week(league.current_week)
+        except Exception as e:
+            print(f"Error refreshing league {league.league_id}: {e}")
+
+
+def watch():
+    """
+    Stay resident and poll ESPN on an adaptive schedule, running analysis and
+    Slack delivery only for teams whose injury statuses or lineup slots changed.
+    """
+    print("Fetching league data...")
+    leagues = get_league_data()
+    if not leagues:
+        print("No leagues found. Check your credentials.")
+        return
+
+    search = CachedSearch(get_search_backend())
+    player_registry: Dict[int, Dict] = {}
+    team_lineups = get_team_lineup_data(leagues, player_registry)
+    matchup_opponents = {
+        (lineup["league_id"], lineup["team_name"]): lineup["matchup_opponent"]
+        for lineup in team_lineups
+    }
+    snapshots = {
+        (lineup["league_id"], lineup["team_name"]): lineup_snapshot(lineup, player_registry)
+        for lineup in team_lineups
+    }
+    last_full_refresh = datetime.now(EASTERN)
+    print(f"Watching {len(snapshots)} team(s). Baseline snapshot taken.")
 
-            if "error" in analysis_json:
-                print(
-                    f"Skipping Slack report due to OpenAI error: {analysis_json['error']}"
+    try:
+        while True:
+            interval = next_poll_interval()
+            print(f"Next check in {interval // 60} minute(s)...")
+            time.sleep(interval)
+
+            try:
+                now = datetime.now(EASTERN)
+                full_refresh = now - last_full_refresh >= full_refresh_interval
+                refresh_rosters(leagues, full_refresh=full_refresh)
+                if full_refresh:
+                    last_full_refresh = now
+                    matchup_opponents = {}
+
+                # Rebuild the registry so injury statuses are current this poll
+                player_registry = {}
+                team_lineups = get_team_lineup_data(
+                    leagues, player_registry, matchup_opponents
                 )
-                continue
 
-            report_blocks = format_analysis_for_slack(team_name, analysis_json)
-            send_to_slack(report_blocks)
+                changed = []
+                for lineup in team_lineups:
+                    key = (lineup["league_id"], lineup["team_name"])
+                    matchup_opponents[key] = lineup["matchup_opponent"]
+                    snapshot = lineup_snapshot(lineup, player_registry)
+                    changes = diff_snapshots(snapshots.get(key, {}), snapshot)
+                    snapshots[key] = snapshot
+                    if changes:
+                        changed.append((lineup, changes))
+
+                if not changed:
+                    print("No injury or lineup changes.")
+                    continue
+
+                # Only re-research players on teams that changed, with fresh news
+                search.clear()
+                gather_player_news(
+                    player_registry,
+                    search,
+                    {
+                        entry["player_id"]
+                        for lineup, _ in changed
+                        for entry in lineup["roster"] + lineup["bench"]
+                    },
+                )
+                for lineup, changes in changed:
+                    print(f"\n--- {lineup['team_name']}: {len(changes)} change(s) ---")
+                    report_team(lineup, player_registry, search, changes)
 
-    except Exception as e:
-        print(f"An error occurred: {e}")
+            except Exception as e:
+                print(f"An error occurred during watch poll: {e}")
+    finally:
+        search.close()
 
 
 if __name__ == "__main__":
     if not os.getenv("OPENAI_API_KEY"):
-        print("Please set your OPENAI_API_KEY environment variable")
-        exit(1)
+        print("⚠️ OPENAI_API_KEY not set. Reports will only include the optimizer lineup.")
     # SLACK_HOOK can be optional for local testing if you don't want to send to Slack
     # if not os.getenv("SLACK_HOOK"):
     #     print("Please set your SLACK_HOOK environment variable")
     #     exit(1)
 
-    main()
+    parser = argparse.ArgumentParser(description="Fantasy football lineup reports")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay running and report only when injuries or lineups change",
+    )
+    args = parser.parse_args()
+
+    if args.watch:
+        watch()
+    else:
+        main()
@@ -2,11 +2,28 @@ import os
 import getpass
 import json
 import requests
-from datetime import date, datetime, timedelta
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from garmy import AuthClient, APIClient
+from garmy.core.endpoint_builders import build_sleep_endpoint
 from dotenv import load_dotenv
 
+# Intraday series are stored one .npy chunk per series per day, as a structured
+# array of (seconds since UTC midnight of that day, value). Chunks are opened
+# memory-mapped, so a year of readings never becomes Python objects.
+INTRADAY_DIR = Path(__file__).parent / "intraday"
+INTRADAY_SERIES = {
+    "heart_rate": np.uint8,  # bpm
+    "stress": np.int8,  # 0-100, negative = rest/activity/no data
+    "sleep_stage": np.uint8,  # one sample per minute, see SLEEP_STAGES
+}
+SLEEP_STAGES = {0: "deep", 1: "light", 2: "rem", 3: "awake"}
+ASLEEP_STAGES = [code for code, name in SLEEP_STAGES.items() if name != "awake"]
+# Garmin Connect's stress bands
+STRESS_BINS = [("Rest", 0, 25), ("Low", 26, 50), ("Medium", 51, 75), ("High", 76, 100)]
+
 
 def _calculate_averages(summaries):
     """Helper function to calculate averages for a list of summaries."""
@@ -157,6 +174,220 @@ def format_comparative_analysis_for_slack(last_30_days_summaries, all_time_summa
     return blocks
 
 
+def _chunk_path(series, day):
+    return INTRADAY_DIR / series / f"{day.isoformat()}.npy"
+
+
+def _day_epoch(day):
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+
+def _write_chunk(series, day, epochs, values):
+    """Store one day of a series as a compact (offset, value) structured array."""
+    dtype = np.dtype([("offset", "<i4"), ("value", INTRADAY_SERIES[series])])
+    chunk = np.empty(len(epochs), dtype=dtype)
+    chunk["offset"] = np.asarray(epochs, dtype=np.int64) - _day_epoch(day)
+    chunk["value"] = values
+    chunk.sort(order="offset")
+
+    path = _chunk_path(series, day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, chunk)
+
+
+def _timestamp_pairs(values_array):
+    """Convert Garmin [[epoch_ms, value], ...] arrays into epoch-second/value arrays."""
+    pairs = np.array(
+        [(row[0], row[1]) for row in values_array or [] if len(row) >= 2 and row[1] is not None],
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    return pairs[:, 0] // 1000, pairs[:, 1]
+
+
+def _sleep_stage_epochs(sleep_levels):
+    """Expand Garmin sleepLevels intervals into one stage sample per minute."""
+    epochs, stages = [], []
+    for level in sleep_levels or []:
+        start = datetime.fromisoformat(level["startGMT"]).replace(tzinfo=timezone.utc)
+        end = datetime.fromisoformat(level["endGMT"]).replace(tzinfo=timezone.utc)
+        minutes = np.arange(int(start.timestamp()), int(end.timestamp()), 60)
+        epochs.append(minutes)
+        stages.append(np.full(len(minutes), int(level["activityLevel"])))
+    if not epochs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(epochs), np.concatenate(stages)
+
+
+def _fetch_intraday_day(api_client, day):
+    """
+    Fetch and store heart rate, stress and sleep-stage series for one day.
+    Days without data still get an empty chunk so they aren't fetched again.
+    """
+    heart_rate = api_client.metrics.get("heart_rate").get(day)
+    _write_chunk(
+        "heart_rate",
+        day,
+        *_timestamp_pairs(heart_rate.heart_rate_values_array if heart_rate else None),
+    )
+
+    stress = api_client.metrics.get("stress").get(day)
+    _write_chunk("stress", day, *_timestamp_pairs(stress.stress_values_array if stress else None))
+
+    sleep_raw = api_client.connectapi(build_sleep_endpoint(day, api_client))
+    sleep_levels = sleep_raw.get("sleepLevels") if isinstance(sleep_raw, dict) else None
+    _write_chunk("sleep_stage", day, *_sleep_stage_epochs(sleep_levels))
+
+
+def ingest_intraday(api_client, days):
+    """
+    Backfill intraday series for the last `days` days. Days already on disk are
+    skipped, except the last two, which may still have been in progress.
+    """
+    today = date.today()
+    to_fetch = [
+        today - timedelta(days=offset)
+        for offset in range(days)
+        if offset < 2
+        or not all(_chunk_path(series, today - timedelta(days=offset)).exists() for series in INTRADAY_SERIES)
+    ]
+    if not to_fetch:
+        return
+
+    print(f"Fetching intraday data for {len(to_fetch)} day(s)...")
+
+    def fetch(day):
+        try:
+            _fetch_intraday_day(api_client, day)
+        except Exception as e:
+            print(f"⚠️ Could not fetch intraday data for {day}: {e}")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(fetch, to_fetch))
+
+
+def load_series(series, start, end):
+    """
+    Load a series between two dates (inclusive) as (epoch seconds, values, day index)
+    arrays. The day index counts days since `start`, for grouping by calendar day.
+    """
+    epochs, values, day_index = [], [], []
+    day = start
+    while day <= end:
+        path = _chunk_path(series, day)
+        if path.exists():
+            chunk = np.load(path, mmap_mode="r")
+            epochs.append(chunk["offset"].astype(np.int64) + _day_epoch(day))
+            values.append(chunk["value"])
+            day_index.append(np.full(len(chunk), (day - start).days, dtype=np.int32))
+        day += timedelta(days=1)
+
+    if not epochs:
+        dtype = INTRADAY_SERIES[series]
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=dtype), np.empty(0, dtype=np.int32)
+    return np.concatenate(epochs), np.concatenate(values), np.concatenate(day_index)
+
+
+def downsample(epochs, values, bucket_seconds, how="mean"):
+    """Aggregate samples into fixed-width time buckets ("mean", "min" or "max")."""
+    if len(epochs) == 0:
+        return epochs, values.astype(np.float64)
+
+    buckets = epochs // bucket_seconds
+    bucket_ids, inverse = np.unique(buckets, return_inverse=True)
+    if how == "mean":
+        totals = np.bincount(inverse, weights=values.astype(np.float64))
+        result = totals / np.bincount(inverse)
+    else:
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(len(bucket_ids)))
+        reducer = np.minimum if how == "min" else np.maximum
+        result = reducer.reduceat(values[order].astype(np.float64), starts)
+    return bucket_ids * bucket_seconds, result
+
+
+def night_hr_minima(start, end):
+    """
+    Lowest 5-minute average heart rate while asleep, for each day in the range.
+    Days without sleep-stage or heart rate data are left out.
+    """
+    hr_epochs, hr_values, _ = load_series("heart_rate", start, end)
+    sleep_epochs, sleep_stages, sleep_days = load_series("sleep_stage", start, end)
+    if len(hr_epochs) == 0 or len(sleep_epochs) == 0:
+        return np.empty(0)
+
+    # A heart rate sample is asleep if it falls inside a one-minute sleep epoch
+    # whose stage isn't "awake"
+    idx = np.searchsorted(sleep_epochs, hr_epochs, side="right") - 1
+    clipped = np.clip(idx, 0, None)
+    asleep = (
+        (idx >= 0)
+        & (hr_epochs - sleep_epochs[clipped] < 60)
+        & np.isin(sleep_stages[clipped], ASLEEP_STAGES)
+    )
+    if not asleep.any():
+        return np.empty(0)
+
+    bucket_epochs, bucket_hr = downsample(hr_epochs[asleep], hr_values[asleep], 300)
+    night = sleep_days[np.clip(np.searchsorted(sleep_epochs, bucket_epochs, side="right") - 1, 0, None)]
+    minima = np.full((end - start).days + 1, np.inf)
+    np.minimum.at(minima, night, bucket_hr)
+    return minima[np.isfinite(minima)]
+
+
+def stress_distribution(start, end):
+    """Share of measured time spent in each stress band, as percentages."""
+    _, values, _ = load_series("stress", start, end)
+    measured = values[values >= 0]
+    if len(measured) == 0:
+        return None
+    return {
+        name: float(np.count_nonzero((measured >= low) & (measured <= high))) / len(measured) * 100
+        for name, low, high in STRESS_BINS
+    }
+
+
+def format_intraday_for_slack(days=30):
+    """
+    Builds Slack blocks for intraday statistics, last `days` days vs. all stored
+    history. The history is labelled with the span actually on disk, since the
+    store may have been rebuilt from the backfill window.
+    """
+    end = date.today()
+    recent_start = end - timedelta(days=days - 1)
+    chunk_days = sorted(
+        path.stem
+        for path in (INTRADAY_DIR / "heart_rate").glob("*.npy")
+        if len(np.load(path, mmap_mode="r"))
+    )
+    if not chunk_days:
+        return []
+    history_start = date.fromisoformat(chunk_days[0])
+    history_label = f"since {history_start.strftime('%b %d, %Y')}"
+
+    recent_minima = night_hr_minima(recent_start, end)
+    history_minima = night_hr_minima(history_start, end)
+    recent_stress = stress_distribution(recent_start, end)
+
+    lines = []
+    if len(recent_minima) and len(history_minima):
+        lines.append(
+            f"*🌙 Night-time HR Minimum (bpm)*\n"
+            f"{recent_minima.mean():.1f} ({days}d) vs {history_minima.mean():.1f} ({history_label}), "
+            f"lowest {recent_minima.min():.0f}"
+        )
+    if recent_stress:
+        lines.append(
+            f"*🧘 Stress Time Distribution ({days}d)*\n"
+            + " · ".join(f"{name} {share:.0f}%" for name, share in recent_stress.items())
+        )
+    if not lines:
+        return []
+
+    return [{"type": "divider"}] + [
+        {"type": "section", "text": {"type": "mrkdwn", "text": line}} for line in lines
+    ]
+
+
 def send_to_slack(report_blocks):
     """Sends the formatted report blocks to a Slack webhook."""
     slack_hook_url = os.environ.get("SLACK_HOOK")
@@ -205,6 +436,7 @@ def main():
         print("Successfully connected!")
 
         days_to_fetch = 365
+        intraday_days = 90
         print(f"\nFetching data for the last {days_to_fetch} days...")
 
         summary_accessor = api_client.metrics.get("daily_summary")
@@ -254,6 +486,13 @@ def main():
             all_time_baseline_data
         )
 
+        # Intraday series only need fetching for days not already stored
+        try:
+            ingest_intraday(api_client, intraday_days)
+            report_blocks += format_intraday_for_slack()
+        except Exception as e:
+            print(f"⚠️ Skipping intraday statistics: {e}")
+
         # Send the report to Slack
         send_to_slack(report_blocks)
 
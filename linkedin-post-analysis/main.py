@@ -1,8 +1,222 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import scipy.stats as stats
 import statsmodels.api as sm
 from statsmodels.formula.api import ols
 
+# --- LinkedIn activity PDF export parsing ---
+POST_MARKERS = (
+    "Promote this post to reach people who matter to you. Boost",
+    "This post is not eligible to be boosted.",
+)
+POST_END = "Comment Repost"
+BOILERPLATE_PATTERNS = [
+    re.compile(r"^Update to our terms$"),
+    re.compile(r"^We.re updating our terms on .*"),
+    re.compile(r"^\d{1,2}/\d{1,2}/\d{2}, \d{1,2}:\d{2} [AP]M Activity \| .* \| LinkedIn$"),
+    re.compile(r"^https://www\.linkedin\.com/\S+ \d+/\d+$"),
+    re.compile(r"^LinkedIn Corporation © \d{4}$"),
+]
+REACTION_SKIP_PATTERN = re.compile(r"^(Like|\d[\d,]* impressions View analytics)$")
+AUTHOR_PATTERN = re.compile(r"•\s*(You|1st|2nd|3rd\+?)$")  # followed by a headline line
+CHROME_PATTERNS = [
+    REACTION_SKIP_PATTERN,
+    re.compile(r".*reposted this$"),
+    re.compile(r"^\d+(m|h|d|w|mo|yr) •( Edited •)?$"),  # "1w •", "1yr • Edited •"
+    re.compile(r"^(Follow|Visit my website|Apply|Edit captions)$"),
+    re.compile(r"^Auto captions have been added to your video$"),
+    re.compile(r"^(Followers|Drafts) [\d,]+$"),
+]
+FOLLOWERS_PATTERN = re.compile(r"^[\d,]+ followers$")  # preceded by a company page name
+COMMENT_COUNT_PATTERN = re.compile(r"^\d[\d,]* (comments?|reposts?)")
+OWNER_PATTERN = re.compile(r"Activity \| (?P<person>.+?) \| LinkedIn")
+REACTION_PATTERNS = [
+    re.compile(r"^(?P<likes>\d[\d,]*)$"),  # "27"
+    re.compile(r"^(?P<likes>\d[\d,]*)[A-Z]"),  # "16Steve Armendariz and 15 others"
+    re.compile(r"^(?P<likes>\d[\d,]*)\s+\d[\d,]*\s+(comments?|reposts?)"),  # "27 5 comments"
+]
+# First-pass guesses for "Post content"; edit the output CSV to refine them.
+CONTENT_KEYWORDS = [
+    ("Career/Job Related", ("hiring", "job", "apply", "join our team", "team is growing", "new role", "promoted")),
+    ("Event Promotion", ("webinar", "register", "join us", "conference", "see you at", "booth")),
+    ("Event Recap", ("recap", "great time at", "thanks to everyone who")),
+    ("Promotion", ("episode", "launch", "check out", "release", "demo", "new feature", "loom.com")),
+    ("Sharing Article/Link", ("article", "blog", "worth a read", "lnkd.in")),
+]
+DEFAULT_CONTENT = "Industry Commentary"
+
+
+def _page_hash(reader, index):
+    """Fingerprint a page by its raw content stream, so unchanged pages can be skipped."""
+    contents = reader.pages[index].get_contents()
+    data = contents.get_data() if contents is not None else b""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _extract_pages(pdf_path, indexes):
+    """Process pool worker: extract the text of a batch of pages."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(pdf_path)
+    return {index: reader.pages[index].extract_text() or "" for index in indexes}
+
+
+def extract_page_texts(pdf_path, cache_path=None, workers=None):
+    """
+    Extract the text of every page, reusing cached text for pages whose content
+    hasn't changed since the last run and spreading the rest across processes.
+    """
+    from pypdf import PdfReader
+
+    cache_path = cache_path or f"{pdf_path}.pages.json"
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+
+    reader = PdfReader(pdf_path)
+    hashes = [_page_hash(reader, index) for index in range(len(reader.pages))]
+    stale = [index for index, page_hash in enumerate(hashes) if page_hash not in cache]
+
+    if stale:
+        print(f"Extracting {len(stale)} of {len(hashes)} pages...")
+        workers = workers or os.cpu_count() or 1
+        batches = [stale[i::workers] for i in range(workers) if stale[i::workers]]
+        with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+            for texts in executor.map(_extract_pages, [pdf_path] * len(batches), batches):
+                for index, text in texts.items():
+                    cache[hashes[index]] = text
+    else:
+        print(f"All {len(hashes)} pages unchanged since the last extraction.")
+
+    # Drop pages that no longer exist in the export
+    cache = {page_hash: cache[page_hash] for page_hash in hashes}
+    with open(cache_path, "w") as f:
+        json.dump(cache, f)
+
+    return [cache[page_hash] for page_hash in hashes]
+
+
+def _guess_post_content(text):
+    lowered = text.lower()
+    for category, keywords in CONTENT_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return category
+    return DEFAULT_CONTENT
+
+
+def _like_count(block):
+    """Read the like count from the reactions line near the end of a post."""
+    for line in reversed(block):
+        if REACTION_SKIP_PATTERN.match(line):
+            continue
+        for pattern in REACTION_PATTERNS:
+            match = pattern.match(line)
+            if match:
+                return int(match.group("likes").replace(",", ""))
+        return 0
+    return 0
+
+
+def _post_text_lines(block, person):
+    """
+    Drop LinkedIn page chrome from a post block: reaction and impression lines,
+    author names with their headlines, timestamps and buttons.
+    """
+    lines = []
+    headlines = set()
+    expect_headline = False
+    for line in block:
+        if any(pattern.match(line) for pattern in CHROME_PATTERNS):
+            continue
+        if AUTHOR_PATTERN.search(line):
+            expect_headline = True
+            continue
+        if expect_headline:
+            headlines.add(line)
+            expect_headline = False
+            continue
+        if FOLLOWERS_PATTERN.match(line):
+            if lines:
+                lines.pop()
+            continue
+        if line == person or line in headlines:
+            continue
+        lines.append(line)
+
+    # The reactions line ends up last once the chrome around it is gone
+    if lines and (
+        any(pattern.match(lines[-1]) for pattern in REACTION_PATTERNS)
+        or COMMENT_COUNT_PATTERN.match(lines[-1])
+    ):
+        lines.pop()
+    return lines
+
+
+def parse_activity_rows(page_texts):
+    """
+    Yield one row per post (Person, Post type, Post content, Like count, Post text)
+    from the page texts of a LinkedIn activity export. Posts that run across a
+    page break are stitched back together.
+    """
+    owner_match = OWNER_PATTERN.search("\n".join(page_texts))
+    person = owner_match.group("person") if owner_match else "Unknown"
+
+    lines = [
+        line.strip()
+        for text in page_texts
+        for line in text.splitlines()
+        if line.strip()
+        and not any(pattern.match(line.strip()) for pattern in BOILERPLATE_PATTERNS)
+    ]
+
+    block = None
+    for line in lines:
+        if line in POST_MARKERS:
+            block = []
+            continue
+        if block is None:
+            continue
+        if line == POST_END:
+            is_repost = any(line.endswith("reposted this") for line in block)
+            text = " ".join(_post_text_lines(block, person))
+            yield {
+                "Person": person,
+                "Post type": "Repost" if is_repost else "Personal",
+                "Post content": _guess_post_content(text),
+                # A repost's reactions belong to the original author
+                "Like count": 0 if is_repost else _like_count(block),
+                "Post text": text,
+            }
+            block = None
+            continue
+        block.append(line)
+
+
+def extract_linkedin_pdf(pdf_path, output_path="activity_data_extracted.csv", workers=None):
+    """
+    Convert a LinkedIn activity PDF export into the CSV format read by
+    analyze_linkedin_data, writing rows as they are parsed.
+    """
+    page_texts = extract_page_texts(pdf_path, workers=workers)
+    fieldnames = ["Person", "Post type", "Post content", "Like count", "Post text"]
+    row_count = 0
+    with open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in parse_activity_rows(page_texts):
+            writer.writerow(row)
+            row_count += 1
+    print(f"Wrote {row_count} posts to '{output_path}'.")
+    return output_path
+
 
 def analyze_linkedin_data(file_path="activity_data.csv"):
     """
@@ -154,4 +368,23 @@ def analyze_linkedin_data(file_path="activity_data.csv"):
 
 
 if __name__ == "__main__":
-    analyze_linkedin_data()
+    parser = argparse.ArgumentParser(description="LinkedIn post engagement analysis")
+    parser.add_argument(
+        "--extract",
+        metavar="PDF",
+        help="Convert a LinkedIn activity PDF export to CSV instead of running the analysis",
+    )
+    parser.add_argument(
+        "--output",
+        default="activity_data_extracted.csv",
+        help="CSV path for --extract output",
+    )
+    parser.add_argument(
+        "--data", default="activity_data.csv", help="CSV file to analyze"
+    )
+    args = parser.parse_args()
+
+    if args.extract:
+        extract_linkedin_pdf(args.extract, args.output)
+    else:
+        analyze_linkedin_data(args.data)